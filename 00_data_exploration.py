@@ -4,42 +4,140 @@ Task 0: Data Exploration & Familiarization
 This script explores the US Accidents dataset to understand its structure,
 data types, missing values, and key statistics.
 
-Dataset: US_Accidents_March23.csv
+Dataset: US_Accidents_March23.csv (converted once to US_Accidents_March23.parquet)
 Records: 7,728,394 accidents
 Columns: 46 features including location, severity, weather, time, and road conditions
 """
 
+import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+def convert_csv_to_parquet(src, dst):
+    """
+    One-shot conversion of the raw CSV to Parquet so later steps can
+    read only the columns they need instead of re-parsing the full CSV.
+    
+    Parameters:
+    - src: Raw CSV file path
+    - dst: Output Parquet file path
+    """
+    print(f"Converting {src} to Parquet...")
+    
+    category = pa.dictionary(pa.int32(), pa.string())
+    bool_cols = ['Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 
+                 'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop',
+                 'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
+    
+    column_types = {
+        'ID': category,
+        'Start_Lat': pa.float32(),
+        'Start_Lng': pa.float32(),
+        'Severity': pa.uint8(),
+        'State': category,
+        'City': category,
+        'County': category,
+        'Weather_Condition': category,
+        'Wind_Direction': category,
+        'Sunrise_Sunset': category,
+        # Some rows carry nanosecond fractions, so parse at 'ns' resolution
+        'Start_Time': pa.timestamp('ns'),
+        'End_Time': pa.timestamp('ns'),
+    }
+    column_types.update({col: pa.bool_() for col in bool_cols})
+    
+    table = pv.read_csv(
+        src,
+        convert_options=pv.ConvertOptions(
+            column_types=column_types,
+            strings_can_be_null=True
+        )
+    )
+    pq.write_table(table, dst, compression='zstd', row_group_size=1_000_000)
+    print(f"Saved: {dst} ({table.num_rows:,} rows)")
+
+def column_statistics(pf):
+    """
+    Combine per-row-group Parquet statistics into one row per column
+    
+    Returns:
+    - DataFrame indexed by column with null_count, min and max
+      (min/max are None where the file has no statistics)
+    """
+    rows = {}
+    metadata = pf.metadata
+    for i, col in enumerate(pf.schema_arrow.names):
+        stats = [metadata.row_group(r).column(i).statistics for r in range(pf.num_row_groups)]
+        if all(st is not None and st.has_null_count for st in stats):
+            null_count = sum(st.null_count for st in stats)
+        else:
+            # Some row group has no null count (e.g. an all-null column), so
+            # count from the column data instead of reporting 0
+            null_count = pf.read(columns=[col]).column(0).null_count
+        stats = [st for st in stats if st is not None]
+        with_min_max = [st for st in stats if st.has_min_max]
+        rows[col] = {
+            'null_count': null_count,
+            'min': min(st.min for st in with_min_max) if with_min_max else None,
+            'max': max(st.max for st in with_min_max) if with_min_max else None
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
 
 def explore_dataset(filepath):
-    """Load and explore the dataset"""
+    """
+    Explore the dataset from Parquet metadata
+    
+    Shape, schema, null counts and value ranges come from the file footer
+    and row-group statistics; only Severity, State and City are read as
+    data for the distinct-value counts.
+    
+    Parameters:
+    - filepath: Parquet file, or the raw CSV, which is first converted to a
+      Parquet file of the same name (reused if it already exists)
+    
+    Returns:
+    - pyarrow ParquetFile for the dataset
+    """
     print("=" * 80)
     print("US ACCIDENTS DATASET - EXPLORATION")
     print("=" * 80)
     
-    df = pd.read_csv(filepath)
+    if filepath.endswith('.csv'):
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        if not os.path.exists(parquet_path):
+            convert_csv_to_parquet(filepath, parquet_path)
+        filepath = parquet_path
+    
+    pf = pq.ParquetFile(filepath)
+    col_stats = column_statistics(pf)
     
     print(f"\n1. DATASET SHAPE")
-    print(f"   Total Records: {df.shape[0]:,}")
-    print(f"   Total Columns: {df.shape[1]}")
+    print(f"   Total Records: {pf.metadata.num_rows:,}")
+    print(f"   Total Columns: {len(pf.schema_arrow)}")
     
     print(f"\n2. DATA TYPES")
-    print(df.dtypes)
+    print(pf.schema_arrow.remove_metadata())
     
     print(f"\n3. MISSING VALUES (Top 10)")
-    missing = df.isnull().sum().sort_values(ascending=False)
+    missing = col_stats['null_count'].astype(int).sort_values(ascending=False)
     print(missing.head(10))
     
+    key_cols = pq.read_table(filepath, columns=['Severity', 'State', 'City']).to_pandas()
+    
     print(f"\n4. KEY STATISTICS")
-    print(f"   Severity Levels: {sorted(df['Severity'].unique())}")
-    print(f"   States Represented: {df['State'].nunique()}")
-    print(f"   Cities: {df['City'].nunique()}")
-    print(f"   Date Range: {df['Start_Time'].min()} to {df['Start_Time'].max()}")
+    # Nullable uint8 comes back as float64 when it has nulls; cast so the
+    # levels print as 1-4 rather than 1.0-4.0
+    print(f"   Severity Levels: {sorted(key_cols['Severity'].dropna().astype(int).unique().tolist())}")
+    print(f"   States Represented: {key_cols['State'].nunique()}")
+    print(f"   Cities: {key_cols['City'].nunique()}")
+    print(f"   Date Range: {col_stats.loc['Start_Time', 'min']} to {col_stats.loc['Start_Time', 'max']}")
     
     print(f"\n5. GEOGRAPHIC COVERAGE")
-    print(f"   Latitude Range: {df['Start_Lat'].min():.2f} to {df['Start_Lat'].max():.2f}")
-    print(f"   Longitude Range: {df['Start_Lng'].min():.2f} to {df['Start_Lng'].max():.2f}")
+    print(f"   Latitude Range: {col_stats.loc['Start_Lat', 'min']:.2f} to {col_stats.loc['Start_Lat', 'max']:.2f}")
+    print(f"   Longitude Range: {col_stats.loc['Start_Lng', 'min']:.2f} to {col_stats.loc['Start_Lng', 'max']:.2f}")
     
     print(f"\n6. KEY COLUMNS FOR ANALYSIS")
     print("   - Start_Lat, Start_Lng: Accident coordinates (for clustering)")
@@ -48,7 +146,9 @@ def explore_dataset(filepath):
     print("   - Weather_Condition: Weather at time of accident")
     print("   - Road Features: Amenity, Bump, Crossing, Junction, Signal, etc.")
     
-    return df
+    return pf
 
 if __name__ == "__main__":
-    df = explore_dataset("US_Accidents_March23.csv")
+    if not os.path.exists("US_Accidents_March23.parquet"):
+        convert_csv_to_parquet("US_Accidents_March23.csv", "US_Accidents_March23.parquet")
+    pf = explore_dataset("US_Accidents_March23.parquet")
@@ -6,33 +6,168 @@ Clean the US Accidents dataset (7.7M records, 47 columns) for two-stage analysis
   Stage 2: Post-clustering policy analysis using categorical and numerical features
 
 Steps:
-1. Load data with feature selection (30 columns from 47)
+1. Load data with feature selection (30 columns from 47, Parquet column projection)
 2. Remove missing critical values
 3. Remove duplicates
 4. Validate coordinate bounds (USA continental)
 5. Remove coordinate outliers (z-score method)
-6. Validate severity values
+6. Validate severity
 7. Process datetime columns
 8. Handle missing values (numerical, categorical, boolean)
 9. Feature engineering (temporal features, duration)
 10. Final quality checks
 11. Save cleaned dataset with comprehensive report
+
+Steps 2-6 are order-sensitive: duplicates are resolved after dropping
+missing values but before any other filter, and the z-score statistics
+are computed after the bounds check and before the severity check.
+clean_dataset_lazy() (run with --lazy) does the same cleaning, in the same
+filter order and with the same output schema, as one Polars streaming
+query when the per-step report is not needed.
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
-from scipy import stats
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.api.types import union_categoricals
 import warnings
 warnings.filterwarnings('ignore')
 
 
+COLUMNS_TO_KEEP = [
+    # Clustering features
+    'Start_Lat', 'Start_Lng',
+    # Identifiers & Impact
+    'ID', 'Severity', 'Start_Time', 'End_Time', 'Distance(mi)',
+    # Geographic (for groupby analysis)
+    'City', 'State', 'County',
+    # Weather features
+    'Temperature(F)', 'Humidity(%)', 'Pressure(in)', 'Visibility(mi)',
+    'Wind_Speed(mph)', 'Precipitation(in)', 'Weather_Condition', 'Wind_Direction',
+    # Road features (boolean POI annotations)
+    'Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 'No_Exit',
+    'Railway', 'Roundabout', 'Station', 'Stop', 'Traffic_Calming',
+    'Traffic_Signal', 'Turning_Loop',
+    # Time of day
+    'Sunrise_Sunset'
+]
+
+BOOL_COLS = ['Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 
+             'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop',
+             'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
+
+WEATHER_COLS = ['Temperature(F)', 'Humidity(%)', 'Pressure(in)', 
+                'Visibility(mi)', 'Wind_Speed(mph)', 'Precipitation(in)']
+
+CRITICAL_COLS = ['Start_Lat', 'Start_Lng', 'Severity', 'Start_Time']
+
+# Explicit dtypes so read_csv skips type inference over 7.7M rows
+CSV_DTYPES = {
+    'Start_Lat': 'float32', 'Start_Lng': 'float32',
+    'Severity': 'UInt8', 'Distance(mi)': 'float32',
+    'Temperature(F)': 'float32', 'Humidity(%)': 'float32',
+    'Pressure(in)': 'float32', 'Visibility(mi)': 'float32',
+    'Wind_Speed(mph)': 'float32', 'Precipitation(in)': 'float32',
+    'ID': 'category',
+    'State': 'category', 'City': 'category', 'County': 'category',
+    'Weather_Condition': 'category', 'Wind_Direction': 'category',
+    'Sunrise_Sunset': 'category'
+}
+CSV_DTYPES.update({col: 'boolean' for col in BOOL_COLS})
+
+# Bit position of each road feature in the packed RoadFeatures column
+ROAD_FEATURE_BITS = {col: i for i, col in enumerate(BOOL_COLS)}
+
+# Column order of the cleaned dataset, shared by both cleaning paths
+OUTPUT_COLUMNS = [col for col in COLUMNS_TO_KEEP if col not in BOOL_COLS] + [
+    'RoadFeatures', 'Hour', 'DayOfWeek', 'Month', 'Year', 'IsWeekend', 'Duration_hours']
+
+# Fill values for missing categorical features
+CATEGORICAL_FILLS = {
+    'Weather_Condition': 'Clear',
+    'Wind_Direction': 'CALM',
+    'City': 'Unknown',
+    'State': 'Unknown',
+    'County': 'Unknown',
+    'Sunrise_Sunset': 'Unknown'
+}
+
+
+def keep_mask(lat, lng):
+    """
+    Validate coordinates against the continental USA bounds in a single pass.
+    
+    Returns:
+    - Boolean keep mask
+    - Counts of out-of-bounds latitudes and longitudes
+    """
+    lat_bad = ~((lat >= 24.0) & (lat <= 50.0))
+    lng_bad = ~((lng >= -125.0) & (lng <= -66.0))
+    keep = ~(lat_bad | lng_bad)
+    return keep, int(lat_bad.sum()), int(lng_bad.sum())
+
+
+def read_source(filepath, chunksize=500_000):
+    """
+    Yield the kept columns of the raw dataset.
+    
+    Parquet is yielded as a single frame; CSV is streamed in chunks of
+    chunksize rows with explicit dtypes.
+    """
+    if filepath.endswith('.parquet'):
+        # Dictionary columns become pandas categoricals (int codes + small
+        # category set), matching the CSV path; the rest stay pyarrow-backed
+        table = pq.read_table(filepath, columns=COLUMNS_TO_KEEP)
+        yield table.to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+        )
+    else:
+        # usecols keeps the file's column order, so reorder to match Parquet
+        for chunk in pd.read_csv(filepath, usecols=COLUMNS_TO_KEEP, dtype=CSV_DTYPES,
+                                 parse_dates=['Start_Time', 'End_Time'], date_format='ISO8601',
+                                 engine='c', chunksize=chunksize):
+            yield chunk[COLUMNS_TO_KEEP]
+
+
+def concat_chunks(chunks):
+    """Concatenate filtered chunks, unifying categorical columns first"""
+    if len(chunks) == 1:
+        return chunks[0]
+    for col in chunks[0].columns:
+        if isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            # Chunks infer their own categories; without a shared set
+            # pd.concat would fall back to object dtype
+            categories = union_categoricals([chunk[col] for chunk in chunks]).categories
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def fill_categorical(series, value):
+    """Fill nulls with value, registering it first on categorical columns"""
+    if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+
+def pack_road_features(df):
+    """Pack the boolean road feature columns into one uint16 bitmask"""
+    bits = np.zeros(len(df), dtype=np.uint16)
+    for col, bit in ROAD_FEATURE_BITS.items():
+        bits |= df[col].to_numpy(dtype=np.uint16) << bit
+    return bits
+
+
 def clean_dataset(filepath, output_filepath=None):
     """
     Clean the US Accidents dataset for K-Means clustering analysis.
     
     Parameters:
-    - filepath: Input CSV file path
-    - output_filepath: Where to save cleaned data (optional)
+    - filepath: Input Parquet (preferred) or CSV file path
+    - output_filepath: Where to save cleaned data, .parquet or .csv (optional)
     
     Returns:
     - Cleaned DataFrame ready for clustering
@@ -40,6 +175,8 @@ def clean_dataset(filepath, output_filepath=None):
     
     # Track statistics for final report
     cleaning_stats = {}
+    columns_to_keep = COLUMNS_TO_KEEP
+    bool_cols = BOOL_COLS
     
     # =========================================================================
     # STEP 1: Load Data with Feature Selection
@@ -48,29 +185,25 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 1: Loading data with feature selection...")
     print("=" * 80)
     
-    columns_to_keep = [
-        # Clustering features
-        'Start_Lat', 'Start_Lng',
-        # Identifiers & Impact
-        'ID', 'Severity', 'Start_Time', 'End_Time', 'Distance(mi)',
-        # Geographic (for groupby analysis)
-        'City', 'State', 'County',
-        # Weather features
-        'Temperature(F)', 'Humidity(%)', 'Pressure(in)', 'Visibility(mi)',
-        'Wind_Speed(mph)', 'Precipitation(in)', 'Weather_Condition', 'Wind_Direction',
-        # Road features (boolean POI annotations)
-        'Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 'No_Exit',
-        'Railway', 'Roundabout', 'Station', 'Stop', 'Traffic_Calming',
-        'Traffic_Signal', 'Turning_Loop',
-        # Time of day
-        'Sunrise_Sunset'
-    ]
-    
-    df = pd.read_csv(filepath, usecols=columns_to_keep)
-    initial_records = len(df)
+    # Parquet is read whole (column projection already bounds memory); the
+    # CSV is streamed and rows missing a critical value are dropped per
+    # chunk. That filter is row-local, so it is safe before the global
+    # duplicate check; every other filter runs on the whole frame below
+    initial_records = 0
+    missing_counts = pd.Series(0, index=CRITICAL_COLS)
+    chunks = []
+    for chunk in read_source(filepath):
+        initial_records += len(chunk)
+        missing = chunk[CRITICAL_COLS].isna()
+        missing_counts += missing.sum()
+        chunks.append(chunk[~missing.any(axis=1).to_numpy()])
+        del chunk, missing
+    df = concat_chunks(chunks)
+    del chunks
+    
     cleaning_stats['initial_records'] = initial_records
     print(f"  Loaded {initial_records:,} records with {len(columns_to_keep)} columns")
-    print(f"  Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    print(f"  Memory usage after dropping missing critical values: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
     
     # =========================================================================
     # STEP 2: Remove Missing Critical Values
@@ -79,19 +212,15 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 2: Removing missing critical values...")
     print("=" * 80)
     
-    critical_cols = ['Start_Lat', 'Start_Lng', 'Severity', 'Start_Time']
-    before = len(df)
-    
-    # Log missing counts before removal
-    for col in critical_cols:
-        missing = df[col].isnull().sum()
+    # Counts were accumulated while loading in STEP 1
+    for col in CRITICAL_COLS:
+        missing = missing_counts[col]
         if missing > 0:
             print(f"  {col}: {missing:,} missing values")
     
-    df = df.dropna(subset=critical_cols)
     after = len(df)
     cleaning_stats['after_critical_nulls'] = after
-    print(f"  Records removed: {before - after:,}")
+    print(f"  Records removed: {initial_records - after:,}")
     print(f"  Records remaining: {after:,}")
     
     # =========================================================================
@@ -102,8 +231,11 @@ def clean_dataset(filepath, output_filepath=None):
     print("=" * 80)
     
     before = len(df)
-    duplicates = df['ID'].duplicated().sum()
-    df = df.drop_duplicates(subset=['ID'], keep='first')
+    # ID is categorical, so this hashes int codes instead of strings;
+    # the mask is computed once and reused for both the count and the filter
+    duplicated = df['ID'].duplicated(keep='first').to_numpy()
+    duplicates = int(duplicated.sum())
+    df = df[~duplicated]
     after = len(df)
     cleaning_stats['after_duplicates'] = after
     print(f"  Duplicate IDs found: {duplicates:,}")
@@ -118,15 +250,14 @@ def clean_dataset(filepath, output_filepath=None):
     print("  Bounds: Latitude 24°N-50°N, Longitude -125°W to -66°W")
     
     before = len(df)
-    
-    # Check out-of-bounds before filtering
-    lat_invalid = ((df['Start_Lat'] < 24) | (df['Start_Lat'] > 50)).sum()
-    lng_invalid = ((df['Start_Lng'] < -125) | (df['Start_Lng'] > -66)).sum()
+    in_bounds, lat_invalid, lng_invalid = keep_mask(
+        df['Start_Lat'].to_numpy(dtype=np.float32),
+        df['Start_Lng'].to_numpy(dtype=np.float32)
+    )
     print(f"  Latitude out of bounds: {lat_invalid:,}")
     print(f"  Longitude out of bounds: {lng_invalid:,}")
     
-    df = df[(df['Start_Lat'] >= 24) & (df['Start_Lat'] <= 50)]
-    df = df[(df['Start_Lng'] >= -125) & (df['Start_Lng'] <= -66)]
+    df = df[in_bounds]
     after = len(df)
     cleaning_stats['after_coord_bounds'] = after
     print(f"  Records removed: {before - after:,}")
@@ -141,9 +272,13 @@ def clean_dataset(filepath, output_filepath=None):
     
     before = len(df)
     
-    # Calculate z-scores for coordinates
-    z_scores = np.abs(stats.zscore(df[['Start_Lat', 'Start_Lng']]))
-    outlier_mask = (z_scores < 3).all(axis=1)
+    # Z-score test per coordinate on the float32 columns (same as scipy's
+    # zscore with ddof=0, without the float64 copy of the whole matrix)
+    lat = df['Start_Lat'].to_numpy(dtype=np.float32)
+    lng = df['Start_Lng'].to_numpy(dtype=np.float32)
+    lat_mu, lat_sd = lat.mean(dtype=np.float64), lat.std(dtype=np.float64)
+    lng_mu, lng_sd = lng.mean(dtype=np.float64), lng.std(dtype=np.float64)
+    outlier_mask = (np.abs(lat - lat_mu) < 3 * lat_sd) & (np.abs(lng - lng_mu) < 3 * lng_sd)
     outliers_count = (~outlier_mask).sum()
     
     df = df[outlier_mask]
@@ -155,13 +290,16 @@ def clean_dataset(filepath, output_filepath=None):
     # =========================================================================
     # STEP 6: Validate Severity
     # =========================================================================
+    # Runs after the z-score step so the outlier statistics are computed
+    # over the same population as before (invalid severities included)
     print("\n" + "=" * 80)
     print("STEP 6: Validating severity values (1-4)...")
     print("=" * 80)
     
     before = len(df)
-    invalid_severity = (~df['Severity'].isin([1, 2, 3, 4])).sum()
-    df = df[df['Severity'].isin([1, 2, 3, 4])]
+    valid_severity = df['Severity'].isin([1, 2, 3, 4]).to_numpy()
+    invalid_severity = int((~valid_severity).sum())
+    df = df[valid_severity]
     after = len(df)
     cleaning_stats['after_severity'] = after
     print(f"  Invalid severity values: {invalid_severity:,}")
@@ -175,11 +313,16 @@ def clean_dataset(filepath, output_filepath=None):
     print("=" * 80)
     
     before = len(df)
-    df['Start_Time'] = pd.to_datetime(df['Start_Time'], errors='coerce')
-    df['End_Time'] = pd.to_datetime(df['End_Time'], errors='coerce')
-    
-    invalid_datetime = df['Start_Time'].isnull().sum()
-    df = df.dropna(subset=['Start_Time'])
+    # Dates are parsed at load time; only columns with unparseable values
+    # were left as strings and still need coercing
+    for col in ['Start_Time', 'End_Time']:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], format='ISO8601', errors='coerce')
+    
+    # Same mask for the count and the filter
+    valid_start = df['Start_Time'].notna().to_numpy()
+    invalid_datetime = int((~valid_start).sum())
+    df = df[valid_start]
     after = len(df)
     cleaning_stats['after_datetime'] = after
     print(f"  Invalid Start_Time values: {invalid_datetime:,}")
@@ -192,8 +335,13 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 8: Handling missing numerical values (median imputation)...")
     print("=" * 80)
     
+    # Null counts for STEPS 8-10 in one pass; each column is only touched by
+    # its own fill, so counts taken here stay valid until that fill runs
+    weather_cols = WEATHER_COLS
+    pre_nulls = df[['Distance(mi)'] + weather_cols + list(CATEGORICAL_FILLS) + bool_cols].isna().sum()
+    
     # Distance
-    distance_nulls = df['Distance(mi)'].isnull().sum()
+    distance_nulls = pre_nulls['Distance(mi)']
     if distance_nulls > 0:
         median_val = df['Distance(mi)'].median()
         df['Distance(mi)'] = df['Distance(mi)'].fillna(median_val)
@@ -202,12 +350,9 @@ def clean_dataset(filepath, output_filepath=None):
         print(f"  Distance(mi): No missing values")
     
     # Weather numerical features
-    weather_cols = ['Temperature(F)', 'Humidity(%)', 'Pressure(in)', 
-                    'Visibility(mi)', 'Wind_Speed(mph)', 'Precipitation(in)']
-    
     for col in weather_cols:
         if col in df.columns:
-            nulls = df[col].isnull().sum()
+            nulls = pre_nulls[col]
             if nulls > 0:
                 median_val = df[col].median()
                 df[col] = df[col].fillna(median_val)
@@ -222,32 +367,10 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 9: Handling missing categorical values...")
     print("=" * 80)
     
-    # Weather categorical
-    weather_cond_nulls = df['Weather_Condition'].isnull().sum()
-    df['Weather_Condition'] = df['Weather_Condition'].fillna('Clear')
-    print(f"  Weather_Condition: {weather_cond_nulls:,} nulls filled with 'Clear'")
-    
-    wind_dir_nulls = df['Wind_Direction'].isnull().sum()
-    df['Wind_Direction'] = df['Wind_Direction'].fillna('CALM')
-    print(f"  Wind_Direction: {wind_dir_nulls:,} nulls filled with 'CALM'")
-    
-    # Location categorical
-    city_nulls = df['City'].isnull().sum()
-    df['City'] = df['City'].fillna('Unknown')
-    print(f"  City: {city_nulls:,} nulls filled with 'Unknown'")
-    
-    state_nulls = df['State'].isnull().sum()
-    df['State'] = df['State'].fillna('Unknown')
-    print(f"  State: {state_nulls:,} nulls filled with 'Unknown'")
-    
-    county_nulls = df['County'].isnull().sum()
-    df['County'] = df['County'].fillna('Unknown')
-    print(f"  County: {county_nulls:,} nulls filled with 'Unknown'")
-    
-    # Time of day
-    sunrise_nulls = df['Sunrise_Sunset'].isnull().sum()
-    df['Sunrise_Sunset'] = df['Sunrise_Sunset'].fillna('Unknown')
-    print(f"  Sunrise_Sunset: {sunrise_nulls:,} nulls filled with 'Unknown'")
+    # Weather, location and time-of-day categoricals
+    for col, value in CATEGORICAL_FILLS.items():
+        df[col] = fill_categorical(df[col], value)
+        print(f"  {col}: {pre_nulls[col]:,} nulls filled with '{value}'")
     
     # =========================================================================
     # STEP 10: Handle Boolean Road Features
@@ -256,24 +379,28 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 10: Handling boolean road features (fill with False)...")
     print("=" * 80)
     
-    bool_cols = ['Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 
-                 'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop',
-                 'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
-    
+    # Columns are loaded as nullable booleans (validity bitmap rather than
+    # object arrays), so one fill + cast to plain numpy bool covers all 13
     total_bool_nulls = 0
     for col in bool_cols:
-        if col in df.columns:
-            nulls = df[col].isnull().sum()
-            if nulls > 0:
-                df[col] = df[col].fillna(False)
-                total_bool_nulls += nulls
-                print(f"  {col}: {nulls:,} nulls filled with False")
+        nulls = pre_nulls[col]
+        if nulls > 0:
+            total_bool_nulls += nulls
+            print(f"  {col}: {nulls:,} nulls filled with False")
+    df[bool_cols] = df[bool_cols].fillna(False).astype('bool')
     
     if total_bool_nulls == 0:
         print("  All boolean columns complete - no missing values")
     else:
         print(f"  Total boolean nulls filled: {total_bool_nulls:,}")
     
+    # Pack the 13 flags into a single uint16 column (bit i = BOOL_COLS[i])
+    df['RoadFeatures'] = pack_road_features(df)
+    df = df.drop(columns=bool_cols)
+    with_features = int((df['RoadFeatures'] > 0).sum())
+    print(f"  Packed {len(bool_cols)} boolean columns into RoadFeatures (uint16 bitmask)")
+    print(f"  Records with at least one road feature: {with_features:,}")
+    
     # =========================================================================
     # STEP 11: Feature Engineering - Temporal Features
     # =========================================================================
@@ -281,11 +408,19 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 11: Creating temporal features...")
     print("=" * 80)
     
-    df['Hour'] = df['Start_Time'].dt.hour
-    df['DayOfWeek'] = df['Start_Time'].dt.dayofweek  # 0=Monday, 6=Sunday
-    df['Month'] = df['Start_Time'].dt.month
-    df['Year'] = df['Start_Time'].dt.year
-    df['IsWeekend'] = df['DayOfWeek'].isin([5, 6]).astype(int)
+    # Derive everything from the int64 nanosecond buffer in one go instead
+    # of four separate .dt passes, storing the results as small ints
+    start = df['Start_Time'].to_numpy(dtype='datetime64[ns]')
+    ts = start.view('int64')
+    days = ts // 86_400_000_000_000
+    months = start.astype('datetime64[M]').view('int64')  # months since 1970-01
+    dow = ((days + 3) % 7).astype(np.uint8)  # 1970-01-01 was a Thursday
+    
+    df['Hour'] = ((ts // 3_600_000_000_000) % 24).astype(np.uint8)
+    df['DayOfWeek'] = dow  # 0=Monday, 6=Sunday
+    df['Month'] = (months % 12 + 1).astype(np.uint8)
+    df['Year'] = (months // 12 + 1970).astype(np.uint16)
+    df['IsWeekend'] = (dow >= 5).astype(np.uint8)
     
     print("  Created features:")
     print("    - Hour (0-23)")
@@ -301,17 +436,22 @@ def clean_dataset(filepath, output_filepath=None):
     print("STEP 12: Calculating accident duration...")
     print("=" * 80)
     
-    df['Duration_hours'] = (df['End_Time'] - df['Start_Time']).dt.total_seconds() / 3600
+    duration = ((df['End_Time'] - df['Start_Time']).dt.total_seconds() / 3600).to_numpy(
+        dtype=np.float64, na_value=np.nan)
     
-    # Handle invalid durations
-    invalid_duration = ((df['Duration_hours'] < 0) | (df['Duration_hours'] > 24) | 
-                        df['Duration_hours'].isnull()).sum()
-    df['Duration_hours'] = df['Duration_hours'].clip(lower=0, upper=24)
-    df['Duration_hours'] = df['Duration_hours'].fillna(df['Duration_hours'].median())
+    # Handle invalid durations: NaN fails both comparisons, so one mask
+    # covers negative, > 24h and missing values
+    invalid_duration = int((~((duration >= 0) & (duration <= 24))).sum())
+    duration = np.clip(duration, 0, 24)
+    # Filling NaNs with the median leaves the median unchanged, so it is
+    # computed once and reused for the report
+    median_duration = np.nanmedian(duration)
+    duration[np.isnan(duration)] = median_duration
+    df['Duration_hours'] = duration
     
     print(f"  Duration_hours created (clipped to 0-24 hours)")
     print(f"  Invalid/extreme durations adjusted: {invalid_duration:,}")
-    print(f"  Median duration: {df['Duration_hours'].median():.2f} hours")
+    print(f"  Median duration: {median_duration:.2f} hours")
     
     # =========================================================================
     # STEP 13: Final Quality Checks
@@ -322,10 +462,13 @@ def clean_dataset(filepath, output_filepath=None):
     
     checks_passed = True
     
+    # Null counts for every column, reused by the summary report below
+    final_nulls = df.isna().sum()
+    
     # Check 1: No nulls in critical columns
     critical_cols = ['Start_Lat', 'Start_Lng', 'Severity', 'Start_Time', 'ID']
     for col in critical_cols:
-        null_count = df[col].isnull().sum()
+        null_count = final_nulls[col]
         if null_count > 0:
             print(f"  ✗ FAIL: {col} has {null_count:,} null values")
             checks_passed = False
@@ -373,11 +516,15 @@ def clean_dataset(filepath, output_filepath=None):
     cleaning_stats['final_records'] = final_records
     
     if output_filepath:
-        df.to_csv(output_filepath, index=False)
+        if output_filepath.endswith('.parquet'):
+            df.to_parquet(output_filepath, engine='pyarrow', index=False, compression='zstd',
+                          row_group_size=1_000_000, use_dictionary=True)
+        else:
+            df.to_csv(output_filepath, index=False)
         print(f"  Saved to: {output_filepath}")
         
         # Save column reference
-        columns_file = output_filepath.replace('.csv', '_columns.txt')
+        columns_file = os.path.splitext(output_filepath)[0] + '_columns.txt'
         with open(columns_file, 'w') as f:
             f.write("US Accidents Cleaned Dataset - Column Reference\n")
             f.write("=" * 50 + "\n\n")
@@ -418,7 +565,7 @@ def clean_dataset(filepath, output_filepath=None):
     print("  - Temperature(F), Humidity(%), Pressure(in), Visibility(mi)")
     print("  - Wind_Speed(mph), Precipitation(in), Weather_Condition, Wind_Direction")
     
-    print("\nRoad Features (13 boolean):")
+    print("\nRoad Features (13 flags packed into RoadFeatures, bit 0-12):")
     print("  - Amenity, Bump, Crossing, Give_Way, Junction, No_Exit, Railway")
     print("  - Roundabout, Station, Stop, Traffic_Calming, Traffic_Signal, Turning_Loop")
     
@@ -461,8 +608,7 @@ def clean_dataset(filepath, output_filepath=None):
     print("  ✓ No duplicate IDs")
     
     # Check remaining nulls
-    remaining_nulls = df.isnull().sum()
-    remaining_nulls = remaining_nulls[remaining_nulls > 0]
+    remaining_nulls = final_nulls[final_nulls > 0]
     if len(remaining_nulls) > 0:
         print("\nRemaining nulls (non-critical):")
         for col, count in remaining_nulls.items():
@@ -476,12 +622,12 @@ def clean_dataset(filepath, output_filepath=None):
     print("=" * 80)
     if output_filepath:
         print(f"1. {output_filepath} - Cleaned dataset")
-        print(f"2. {output_filepath.replace('.csv', '_columns.txt')} - Column reference list")
+        print(f"2. {os.path.splitext(output_filepath)[0]}_columns.txt - Column reference list")
     
     print("\n" + "=" * 80)
     print("READY FOR K-MEANS CLUSTERING")
     print("=" * 80)
-    print("✓ Clustering features: Start_Lat, Start_Lng (ready for StandardScaler)")
+    print("✓ Clustering features: Start_Lat, Start_Lng (standardized in 02_hotspot_identification.py)")
     print("✓ Analysis features: All categorical and numerical features preserved")
     print("✓ No missing values in critical columns")
     print("✓ All validation rules passed")
@@ -491,8 +637,99 @@ def clean_dataset(filepath, output_filepath=None):
     return df
 
 
-if __name__ == "__main__":
-    df_clean = clean_dataset(
-        "US_Accidents_March23.csv", 
-        "US_Accidents_Cleaned.csv"
+def clean_dataset_lazy(filepath, output_filepath=None):
+    """
+    Fast path for clean_dataset as a single Polars lazy query.
+    
+    Applies the same filters, imputation and feature engineering as
+    clean_dataset and writes the same columns, order and dtypes, but lets
+    Polars fuse them into one streaming pass instead of materialising a
+    pandas copy per step. No per-step report is printed; run with
+    01_data_cleaning.py --lazy.
+    
+    Parameters:
+    - filepath: Input Parquet (preferred) or CSV file path
+    - output_filepath: Where to save cleaned data, .parquet or .csv (optional)
+    
+    Returns:
+    - Cleaned Polars DataFrame
+    """
+    import polars as pl
+    
+    print("Running lazy cleaning pipeline (Polars streaming)...")
+    
+    if filepath.endswith('.parquet'):
+        lf = pl.scan_parquet(filepath)
+    else:
+        schema_overrides = {col: pl.Float32 for col in ['Start_Lat', 'Start_Lng', 'Distance(mi)'] + WEATHER_COLS}
+        schema_overrides.update({col: pl.Boolean for col in BOOL_COLS})
+        schema_overrides['Severity'] = pl.UInt8
+        # Parsed dates default to microseconds; clean_dataset keeps nanoseconds
+        lf = pl.scan_csv(filepath, schema_overrides=schema_overrides, try_parse_dates=True).with_columns(
+            pl.col(['Start_Time', 'End_Time']).cast(pl.Datetime('ns')))
+    
+    def median_fill(col):
+        return pl.col(col).fill_null(pl.col(col).median())
+    
+    def zscore_ok(col):
+        return ((pl.col(col) - pl.col(col).mean()).abs() < 3 * pl.col(col).std(ddof=0))
+    
+    duration = (pl.col('End_Time') - pl.col('Start_Time')).dt.total_seconds() / 3600
+    
+    # Filters in the same order as clean_dataset STEPS 2-6
+    lf = (
+        lf.select(COLUMNS_TO_KEEP)
+        .drop_nulls(subset=['Start_Lat', 'Start_Lng', 'Severity', 'Start_Time'])
+        .unique(subset=['ID'], keep='first', maintain_order=True)
+        .filter(pl.col('Start_Lat').is_between(24, 50) & pl.col('Start_Lng').is_between(-125, -66))
+        .filter(zscore_ok('Start_Lat') & zscore_ok('Start_Lng'))
+        .filter(pl.col('Severity').is_in([1, 2, 3, 4]))
+        .with_columns([
+            median_fill('Distance(mi)'),
+            *[median_fill(col) for col in WEATHER_COLS],
+            pl.col('ID').cast(pl.String).cast(pl.Categorical),
+            *[pl.col(col).cast(pl.String).fill_null(value).cast(pl.Categorical)
+              for col, value in CATEGORICAL_FILLS.items()],
+            *[pl.col(col).fill_null(False) for col in BOOL_COLS],
+            # Same small unsigned types as clean_dataset STEP 11
+            pl.col('Start_Time').dt.hour().cast(pl.UInt8).alias('Hour'),
+            (pl.col('Start_Time').dt.weekday() - 1).cast(pl.UInt8).alias('DayOfWeek'),  # 0=Monday, 6=Sunday
+            pl.col('Start_Time').dt.month().cast(pl.UInt8).alias('Month'),
+            pl.col('Start_Time').dt.year().cast(pl.UInt16).alias('Year'),
+            (pl.col('Start_Time').dt.weekday() >= 6).cast(pl.UInt8).alias('IsWeekend'),
+            duration.clip(0, 24).alias('Duration_hours')
+        ])
+        .with_columns(
+            median_fill('Duration_hours'),
+            pl.sum_horizontal([pl.col(col).cast(pl.UInt16) * (1 << bit)
+                               for col, bit in ROAD_FEATURE_BITS.items()])
+              .cast(pl.UInt16).alias('RoadFeatures')
+        )
+        .select(OUTPUT_COLUMNS)
     )
+    
+    df = lf.collect(engine='streaming')
+    print(f"  Cleaned records: {len(df):,}")
+    
+    if output_filepath:
+        if output_filepath.endswith('.parquet'):
+            df.write_parquet(output_filepath, compression='zstd')
+        else:
+            df.write_csv(output_filepath)
+        print(f"  Saved to: {output_filepath}")
+    
+    return df
+
+
+if __name__ == "__main__":
+    # Prefer the Parquet copy written by 00_data_exploration.py
+    source = "US_Accidents_March23.parquet"
+    if not os.path.exists(source):
+        source = "US_Accidents_March23.csv"
+    if '--lazy' in sys.argv[1:]:
+        df_clean = clean_dataset_lazy(source, "US_Accidents_Cleaned.parquet")
+    else:
+        df_clean = clean_dataset(
+            source, 
+            "US_Accidents_Cleaned.parquet"
+        )
@@ -7,11 +7,38 @@ on GPS coordinates (latitude, longitude).
 This identifies geographic clusters of high accident density.
 """
 
+import sys
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-import pickle
+from sklearn.cluster import MiniBatchKMeans
+import copy
+import joblib
+
+# Optional accelerated backends, tried in order: RAPIDS cuML (GPU),
+# then faiss (SIMD CPU kernels), then scikit-learn
+try:
+    import cudf
+    import cuml
+except ImportError:
+    cuml = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Optional: H3 hexagon binning as a deterministic alternative to K-Means
+# (run with --hex); h3ronpy, when installed, converts all coordinates in
+# one vectorized call instead of one h3 call per row
+try:
+    import h3.api.numpy_int as h3
+except ImportError:
+    h3 = None
+
+try:
+    from h3ronpy.vector import coordinates_to_cells
+except ImportError:
+    coordinates_to_cells = None
 
 def identify_hotspots(filepath, n_clusters=50, output_prefix=None):
     """
@@ -24,35 +51,67 @@ def identify_hotspots(filepath, n_clusters=50, output_prefix=None):
     
     Returns:
     - DataFrame with cluster assignments
-    - KMeans model
+    - KMeans model (cuML or faiss model when those are installed), fitted on
+      standardized coordinates; scaling_mean_ and scaling_std_ hold the scaling
     - Cluster centers
     """
     print(f"Loading cleaned dataset...")
-    df = pd.read_csv(filepath)
+    # Only the columns used for clustering and cluster statistics
+    columns = ['ID', 'Start_Lat', 'Start_Lng', 'Severity', 'Distance(mi)']
+    if filepath.endswith('.parquet'):
+        df = pd.read_parquet(filepath, columns=columns)
+    else:
+        df = pd.read_csv(filepath, usecols=columns)
     
     # Prepare coordinates for clustering
-    coords = df[['Start_Lat', 'Start_Lng']].values
-    print(f"Data points for clustering: {coords.shape[0]:,}")
+    coords_scaled = df[['Start_Lat', 'Start_Lng']].to_numpy(dtype=np.float32, copy=True)
+    print(f"Data points for clustering: {coords_scaled.shape[0]:,}")
     
-    # Standardize coordinates (important for K-Means)
-    scaler = StandardScaler()
-    coords_scaled = scaler.fit_transform(coords)
+    # Standardize coordinates in place (important for K-Means); stays
+    # float32 instead of StandardScaler's float64 copies
+    coord_mean = coords_scaled.mean(axis=0, dtype=np.float64)
+    coord_std = coords_scaled.std(axis=0, dtype=np.float64)
+    coords_scaled -= coord_mean.astype(np.float32)
+    coords_scaled /= coord_std.astype(np.float32)
     
     # Apply K-Means clustering
-    print(f"Running K-Means clustering with {n_clusters} clusters...")
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-    df['Cluster'] = kmeans.fit_predict(coords_scaled)
+    if cuml is not None:
+        print(f"Running K-Means clustering with {n_clusters} clusters (cuML GPU)...")
+        gdf = cudf.DataFrame({'lat': coords_scaled[:, 0], 'lng': coords_scaled[:, 1]})
+        kmeans = cuml.KMeans(n_clusters=n_clusters, n_init=3, random_state=42, max_iter=100)
+        df['Cluster'] = kmeans.fit_predict(gdf).to_numpy()
+    elif faiss is not None:
+        print(f"Running K-Means clustering with {n_clusters} clusters (faiss)...")
+        kmeans = faiss.Kmeans(coords_scaled.shape[1], n_clusters, niter=20, nredo=3, seed=42)
+        kmeans.train(coords_scaled)
+        _, labels = kmeans.index.search(coords_scaled, 1)
+        df['Cluster'] = labels.ravel()
+    else:
+        print(f"Running Mini-Batch K-Means clustering with {n_clusters} clusters...")
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3,
+                                 batch_size=8192, max_iter=100, reassignment_ratio=0.01)
+        df['Cluster'] = kmeans.fit_predict(coords_scaled)
+    
+    # Keep the scaling so centroids can be mapped back to degrees
+    # (center * scaling_std_ + scaling_mean_)
+    kmeans.scaling_mean_ = coord_mean
+    kmeans.scaling_std_ = coord_std
     
     # Analyze clusters
     print("\nCluster Analysis:")
-    cluster_stats = df.groupby('Cluster').agg({
-        'ID': 'count',
-        'Severity': ['mean', 'max'],
-        'Distance(mi)': 'mean',
-        'Start_Lat': 'mean',
-        'Start_Lng': 'mean'
-    }).round(3)
-    cluster_stats.columns = ['Count', 'Avg_Severity', 'Max_Severity', 'Avg_Distance', 'Center_Lat', 'Center_Lng']
+    # Named aggregation over only the columns involved; results are sorted
+    # by Count afterwards, so the groupby's own key sort is skipped
+    sub = df[['Cluster', 'Severity', 'Distance(mi)', 'Start_Lat', 'Start_Lng']]
+    cluster_stats = sub.groupby('Cluster', sort=False, observed=True).agg(
+        Count=('Severity', 'size'),
+        Avg_Severity=('Severity', 'mean'),
+        Max_Severity=('Severity', 'max'),
+        Avg_Distance=('Distance(mi)', 'mean'),
+        Center_Lat=('Start_Lat', 'mean'),
+        Center_Lng=('Start_Lng', 'mean')
+    )
+    # Coordinates are float32; widen the K centers so rounding prints cleanly
+    cluster_stats = cluster_stats.astype({'Center_Lat': np.float64, 'Center_Lng': np.float64}).round(3)
     cluster_stats = cluster_stats.sort_values('Count', ascending=False)
     
     print("\nTop 10 Hotspots (by accident count):")
@@ -60,17 +119,84 @@ def identify_hotspots(filepath, n_clusters=50, output_prefix=None):
     
     # Save results if requested
     if output_prefix:
-        df.to_csv(f"{output_prefix}_with_clusters.csv", index=False)
+        # Only the new column plus the row key; join back onto the cleaned
+        # dataset on ID instead of rewriting every column
+        pd.DataFrame({'ID': df['ID'], 'Cluster': df['Cluster'].astype(np.int16)}).to_parquet(
+            f"{output_prefix}_clusters.parquet", index=False, compression='zstd')
         cluster_stats.to_csv(f"{output_prefix}_hotspot_stats.csv")
-        with open(f"{output_prefix}_kmeans_model.pkl", 'wb') as f:
-            pickle.dump(kmeans, f)
+        if cuml is None and faiss is not None:
+            # write_index only stores the centroids, so the coordinate
+            # scaling goes in a sidecar next to it
+            faiss.write_index(kmeans.index, f"{output_prefix}_kmeans.faissindex")
+            np.savez(f"{output_prefix}_kmeans_scaling.npz",
+                     mean=kmeans.scaling_mean_, std=kmeans.scaling_std_)
+        else:
+            # labels_ duplicates the saved Cluster column, so leave it out
+            kmeans_lite = copy.copy(kmeans)
+            if hasattr(kmeans_lite, 'labels_'):
+                del kmeans_lite.labels_
+            joblib.dump(kmeans_lite, f"{output_prefix}_kmeans_model.joblib", compress=('lz4', 3))
         print(f"\nResults saved with prefix: {output_prefix}")
     
     return df, kmeans, cluster_stats
 
+def identify_hex_hotspots(df, resolution=8, top_n=50, output_prefix=None):
+    """
+    Identify accident hotspots by binning coordinates into H3 hexagons
+    
+    Every accident is hashed to its H3 cell (resolution 8 is ~0.7 km^2),
+    so unlike K-Means there is no iterative fit and the cells are true
+    geographic areas rather than clusters in degree space. The hashing is
+    vectorized with h3ronpy when it is installed and falls back to one h3
+    call per row otherwise.
+    
+    Parameters:
+    - df: Cleaned dataset with Start_Lat, Start_Lng and Severity
+    - resolution: H3 resolution (default 8)
+    - top_n: Number of densest cells to report (default 50)
+    - output_prefix: Prefix for saving results
+    
+    Returns:
+    - DataFrame of the top_n cells by accident count
+    """
+    print(f"\nBinning accidents into H3 cells (resolution {resolution})...")
+    lat = df['Start_Lat'].to_numpy(dtype=np.float64)
+    lng = df['Start_Lng'].to_numpy(dtype=np.float64)
+    if coordinates_to_cells is not None:
+        cells = np.asarray(coordinates_to_cells(lat, lng, resolution)).astype(np.uint64)
+    else:
+        cells = np.fromiter((h3.latlng_to_cell(a, b, resolution) for a, b in zip(lat, lng)),
+                            dtype=np.uint64, count=len(lat))
+    
+    hex_stats = df[['Severity']].assign(H3_Cell=cells).groupby('H3_Cell', observed=True, sort=False).agg(
+        Count=('Severity', 'size'),
+        Avg_Severity=('Severity', 'mean')
+    ).round(3)
+    hex_stats = hex_stats.nlargest(top_n, 'Count')
+    centers = np.array([h3.cell_to_latlng(cell) for cell in hex_stats.index])
+    hex_stats['Center_Lat'] = centers[:, 0].round(5)
+    hex_stats['Center_Lng'] = centers[:, 1].round(5)
+    hex_stats.index = [f"{cell:x}" for cell in hex_stats.index]
+    hex_stats.index.name = 'H3_Cell'
+    
+    print(f"Non-empty cells: {len(np.unique(cells)):,}")
+    print("\nTop 10 Hex Hotspots (by accident count):")
+    print(hex_stats.head(10))
+    
+    if output_prefix:
+        hex_stats.to_csv(f"{output_prefix}_h3_stats.csv")
+        print(f"\nH3 results saved with prefix: {output_prefix}")
+    
+    return hex_stats
+
 if __name__ == "__main__":
     df_clustered, model, stats = identify_hotspots(
-        "US_Accidents_Cleaned.csv",
+        "US_Accidents_Cleaned.parquet",
         n_clusters=50,
         output_prefix="hotspots"
     )
+    if '--hex' in sys.argv[1:]:
+        if h3 is None:
+            print("\n--hex requires the h3 package (pip install 'h3>=4'); skipping H3 binning")
+        else:
+            hex_stats = identify_hex_hotspots(df_clustered, resolution=8, output_prefix="hotspots")
@@ -8,59 +8,163 @@ Create visualizations of accident hotspots:
 - Geographic distribution maps
 """
 
+import os
+import sys
+import hashlib
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 import seaborn as sns
 import folium
-from folium.plugins import HeatMap, MarkerCluster
+from folium.plugins import HeatMap, FastMarkerCluster
+from sampling import sample_csv
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional: fast-histogram's uniform-bin C kernel; NumPy is used otherwise
+try:
+    from fast_histogram import histogram2d
+except ImportError:
+    histogram2d = None
+
+# Columns the plots read, with compact dtypes (Cluster comes from the
+# clusters sidecar, joined on ID)
+VIZ_COLS = {
+    'ID': 'category',
+    'Start_Lat': 'float32',
+    'Start_Lng': 'float32',
+    'Severity': 'int8',
+    'City': 'category'
+}
+
+def map_cache_key(df, columns, *extra):
+    """blake2b digest of the data (and any extra settings) behind an HTML map"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df[columns], index=False).to_numpy().tobytes())
+    h.update(repr(extra).encode())
+    return h.hexdigest()
+
+def map_is_current(output_file, key):
+    """Whether output_file exists and was rendered from data with this key"""
+    try:
+        with open(output_file + '.key') as f:
+            return f.read() == key and os.path.exists(output_file)
+    except FileNotFoundError:
+        return False
+
+def save_map(m, output_file, key):
+    """Save a Folium map with its .key sidecar"""
+    m.save(output_file)
+    with open(output_file + '.key', 'w') as f:
+        f.write(key)
+    print(f"Saved: {output_file}")
+
+def new_map_figure():
+    """
+    Figure and axes for the static maps.
+    
+    Margins are fixed instead of using bbox_inches='tight', which renders
+    the figure a second time when saving.
+    """
+    fig, ax = plt.subplots(figsize=(15, 10), dpi=100)
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.94, bottom=0.06)
+    return fig, ax
+
 def create_heatmap_matplotlib(df, output_file=None):
     """Create 2D density heatmap using matplotlib"""
     print("Creating matplotlib heatmap...")
     
-    fig, ax = plt.subplots(figsize=(15, 10))
+    fig, ax = new_map_figure()
+    
+    # Create 2D histogram heatmap over uniform bins; the upper edge is
+    # nudged so the max point lands in the last (right-open) bin
+    lng = df['Start_Lng'].to_numpy(dtype=np.float64)
+    lat = df['Start_Lat'].to_numpy(dtype=np.float64)
+    rng = [[lng.min(), np.nextafter(lng.max(), np.inf)],
+           [lat.min(), np.nextafter(lat.max(), np.inf)]]
+    if histogram2d is not None:
+        H = histogram2d(lng, lat, range=rng, bins=[100, 100])
+    else:
+        H, _, _ = np.histogram2d(lng, lat, range=rng, bins=[100, 100])
+    H = np.ma.masked_less(H, 1)
     
-    # Create 2D histogram heatmap
-    h = ax.hist2d(df['Start_Lng'], df['Start_Lat'], 
-                   bins=100, cmap='YlOrRd', cmin=1)
+    im = ax.imshow(H.T, origin='lower', cmap='YlOrRd', aspect='auto', rasterized=True,
+                   extent=[rng[0][0], rng[0][1], rng[1][0], rng[1][1]])
     
-    plt.colorbar(h[3], ax=ax, label='Accident Density')
+    plt.colorbar(im, ax=ax, label='Accident Density')
     ax.set_xlabel('Longitude')
     ax.set_ylabel('Latitude')
     ax.set_title('US Accident Density Heatmap (2D Histogram)', fontsize=14, fontweight='bold')
     
     if output_file:
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=100)
         print(f"Saved: {output_file}")
     
     plt.close()
 
+def cluster_centroids(df):
+    """
+    Mean coordinates and size of each cluster in one sorted pass
+    
+    Returns:
+    - Cluster IDs, centroid latitudes, centroid longitudes, point counts
+    """
+    cluster = df['Cluster'].to_numpy()
+    order = np.argsort(cluster, kind='stable')
+    c = cluster[order]
+    lat = df['Start_Lat'].to_numpy(dtype=np.float64)[order]
+    lng = df['Start_Lng'].to_numpy(dtype=np.float64)[order]
+    # Start offset of each run of equal cluster IDs
+    breaks = np.flatnonzero(np.diff(c, prepend=c[0] - 1))
+    counts = np.diff(np.append(breaks, len(c)))
+    return (c[breaks], np.add.reduceat(lat, breaks) / counts,
+            np.add.reduceat(lng, breaks) / counts, counts)
+
 def create_cluster_scatter(df, output_file=None):
-    """Create scatter plot of clusters"""
+    """Create cluster map, rasterized so draw cost does not grow with N"""
     print("Creating cluster scatter plot...")
     
-    fig, ax = plt.subplots(figsize=(15, 10))
-    
-    scatter = ax.scatter(df['Start_Lng'], df['Start_Lat'], 
-                        c=df['Cluster'], cmap='tab20', 
-                        alpha=0.6, s=10, edgecolors='none')
-    
-    plt.colorbar(scatter, ax=ax, label='Cluster ID')
+    fig, ax = new_map_figure()
+    
+    # Each cell of a 300x200 grid takes the most common cluster among its
+    # points; the image is drawn instead of one path per accident
+    lng = df['Start_Lng'].to_numpy(dtype=np.float64)
+    lat = df['Start_Lat'].to_numpy(dtype=np.float64)
+    cluster = df['Cluster'].to_numpy(dtype=np.int64)
+    nx, ny, k = 300, 200, int(cluster.max()) + 1
+    extent = [lng.min(), lng.max(), lat.min(), lat.max()]
+    ix = np.minimum(((lng - extent[0]) / ((extent[1] - extent[0]) or 1.0) * nx).astype(np.int64), nx - 1)
+    iy = np.minimum(((lat - extent[2]) / ((extent[3] - extent[2]) or 1.0) * ny).astype(np.int64), ny - 1)
+    counts = np.bincount((iy * nx + ix) * k + cluster, minlength=ny * nx * k).reshape(ny, nx, k)
+    grid = np.ma.masked_where(counts.sum(axis=2) == 0, counts.argmax(axis=2))
+    
+    im = ax.imshow(grid, origin='lower', extent=extent, cmap='tab20', aspect='auto',
+                   interpolation='nearest', vmin=0, vmax=k - 1, rasterized=True)
+    
+    # Mark the K centroids on top, sized by cluster population
+    _, cent_lat, cent_lng, counts = cluster_centroids(df)
+    ax.scatter(cent_lng, cent_lat, s=20 + 200 * np.sqrt(counts / counts.max()),
+               c='black', marker='x', linewidths=1.5, label='Cluster centroid')
+    ax.legend(loc='lower left')
+    
+    plt.colorbar(im, ax=ax, label='Cluster ID')
     ax.set_xlabel('Longitude')
     ax.set_ylabel('Latitude')
     ax.set_title('K-Means Clustering of Accidents (GPS Coordinates)', fontsize=14, fontweight='bold')
     
     if output_file:
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=100)
         print(f"Saved: {output_file}")
     
     plt.close()
 
-def create_interactive_heatmap(df, output_file='accident_heatmap.html'):
-    """Create interactive heatmap using Folium"""
+def map_center(df):
+    """Mean (lat, lng) of the accidents, in one reduction over both columns"""
+    return tuple(df[['Start_Lat', 'Start_Lng']].to_numpy(dtype=np.float64).mean(axis=0))
+
+def create_interactive_heatmap(df, output_file='accident_heatmap.html', center=None):
+    """Create interactive heatmap using Folium, centered on center=(lat, lng) if given"""
     print("Creating interactive Folium heatmap...")
     
     # Sample data if too large (for performance)
@@ -71,8 +175,13 @@ def create_interactive_heatmap(df, output_file='accident_heatmap.html'):
         df_sample = df
     
     # Center of US
-    center_lat = df['Start_Lat'].mean()
-    center_lng = df['Start_Lng'].mean()
+    center_lat, center_lng = center if center is not None else map_center(df)
+    
+    # Skip the render when the map already reflects this sample
+    key = map_cache_key(df_sample, ['Start_Lat', 'Start_Lng'], center_lat, center_lng)
+    if map_is_current(output_file, key):
+        print(f"Up to date: {output_file}")
+        return
     
     m = folium.Map(
         location=[center_lat, center_lng],
@@ -80,17 +189,15 @@ def create_interactive_heatmap(df, output_file='accident_heatmap.html'):
         tiles='OpenStreetMap'
     )
     
-    # Add heatmap layer
-    heat_data = [[row['Start_Lat'], row['Start_Lng']] 
-                 for idx, row in df_sample.iterrows()]
+    # Add heatmap layer (column extraction, no per-row Series)
+    heat_data = df_sample[['Start_Lat', 'Start_Lng']].to_numpy(dtype=np.float64).tolist()
     
     HeatMap(heat_data, radius=15, blur=25, max_zoom=1).add_to(m)
     
-    m.save(output_file)
-    print(f"Saved: {output_file}")
+    save_map(m, output_file, key)
 
-def create_interactive_clusters(df, output_file='accident_clusters.html'):
-    """Create interactive cluster map using Folium"""
+def create_interactive_clusters(df, output_file='accident_clusters.html', center=None):
+    """Create interactive cluster map using Folium, centered on center=(lat, lng) if given"""
     print("Creating interactive Folium cluster map...")
     
     # Sample data if too large
@@ -100,8 +207,13 @@ def create_interactive_clusters(df, output_file='accident_clusters.html'):
     else:
         df_sample = df
     
-    center_lat = df['Start_Lat'].mean()
-    center_lng = df['Start_Lng'].mean()
+    center_lat, center_lng = center if center is not None else map_center(df)
+    
+    key = map_cache_key(df_sample, ['Start_Lat', 'Start_Lng', 'Severity', 'City'],
+                        center_lat, center_lng)
+    if map_is_current(output_file, key):
+        print(f"Up to date: {output_file}")
+        return
     
     m = folium.Map(
         location=[center_lat, center_lng],
@@ -109,50 +221,82 @@ def create_interactive_clusters(df, output_file='accident_clusters.html'):
         tiles='OpenStreetMap'
     )
     
-    # Add cluster markers
-    marker_cluster = MarkerCluster().add_to(m)
-    
-    for idx, row in df_sample.iterrows():
-        folium.Marker(
-            location=[row['Start_Lat'], row['Start_Lng']],
-            popup=f"Severity: {row['Severity']}<br>City: {row['City']}",
-            icon=folium.Icon(color='red', icon='info-sign')
-        ).add_to(marker_cluster)
-    
-    m.save(output_file)
-    print(f"Saved: {output_file}")
+    # Add cluster markers: the points go out as one array and the browser
+    # builds each marker and popup, instead of a folium.Marker per row
+    rows = pd.DataFrame({
+        'lat': df_sample['Start_Lat'].to_numpy(dtype=np.float64),
+        'lng': df_sample['Start_Lng'].to_numpy(dtype=np.float64),
+        'severity': df_sample['Severity'].to_numpy(dtype=np.int64),
+        'city': df_sample['City'].astype(str).to_numpy()
+    }).to_numpy().tolist()
+    callback = """
+    function (row) {
+        var icon = L.AwesomeMarkers.icon({markerColor: 'red', icon: 'info-sign', prefix: 'glyphicon'});
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup('Severity: ' + row[2] + '<br>City: ' + row[3]);
+        return marker;
+    };
+    """
+    FastMarkerCluster(rows, callback=callback).add_to(m)
+    
+    save_map(m, output_file, key)
 
 def create_severity_heatmap(df, output_file=None):
     """Create heatmap colored by severity"""
     print("Creating severity-weighted heatmap...")
     
-    fig, ax = plt.subplots(figsize=(15, 10))
+    fig, ax = new_map_figure()
     
-    scatter = ax.scatter(df['Start_Lng'], df['Start_Lat'], 
-                        c=df['Severity'], cmap='RdYlGn_r', 
-                        alpha=0.5, s=20, edgecolors='none')
+    # Mean severity per hexagon: render cost depends on gridsize, not N
+    hb = ax.hexbin(df['Start_Lng'], df['Start_Lat'], C=df['Severity'].to_numpy(),
+                   reduce_C_function=np.mean, gridsize=200, cmap='RdYlGn_r', mincnt=1,
+                   rasterized=True)
     
-    plt.colorbar(scatter, ax=ax, label='Severity (1=Low, 4=Critical)')
+    plt.colorbar(hb, ax=ax, label='Avg Severity (1=Low, 4=Critical)')
     ax.set_xlabel('Longitude')
     ax.set_ylabel('Latitude')
     ax.set_title('Accident Severity Distribution Across US', fontsize=14, fontweight='bold')
     
     if output_file:
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=100)
         print(f"Saved: {output_file}")
     
     plt.close()
 
-def create_visualizations(csv_filepath):
-    """Create all visualizations"""
+def load_visualization_data(filepath, clusters_filepath=None):
+    """
+    Load and sample the data for the visualizations
+    
+    Parameters:
+    - filepath: Cleaned dataset, .parquet (only VIZ_COLS, plus Cluster when
+      the file has it) or .csv
+    - clusters_filepath: Parquet sidecar of ID/Cluster pairs from step 2 (optional)
+    
+    Returns:
+    - DataFrame of at most 500,000 records
+    """
     print("Loading data for visualizations...")
-    df = pd.read_csv(csv_filepath)
+    if filepath.endswith('.parquet'):
+        columns = list(VIZ_COLS)
+        if 'Cluster' in pq.read_schema(filepath).names:
+            columns.append('Cluster')
+        df = pd.read_parquet(filepath, columns=columns).astype(VIZ_COLS)
+        total = len(df)
+        if total > 500000:
+            df = df.sample(n=500000, random_state=42)
+    else:
+        df, total = sample_csv(filepath, 500000, list(VIZ_COLS), VIZ_COLS)
     
-    # Sample for faster processing if needed
-    if len(df) > 500000:
-        print(f"Sampling data from {len(df):,} to 500,000 records for faster processing")
-        df = df.sample(n=500000, random_state=42)
+    if total > 500000:
+        print(f"Sampled data from {total:,} to 500,000 records for faster processing")
     
+    if clusters_filepath:
+        df = df.merge(pd.read_parquet(clusters_filepath, columns=['ID', 'Cluster']), on='ID')
+    
+    return df
+
+def create_visualizations(df):
+    """Create all visualizations from a loaded (and sampled) DataFrame"""
     print(f"\nCreating visualizations...")
     create_heatmap_matplotlib(df, 'heatmap_density.png')
     create_severity_heatmap(df, 'heatmap_severity.png')
@@ -161,14 +305,22 @@ def create_visualizations(csv_filepath):
     if 'Cluster' in df.columns:
         create_cluster_scatter(df, 'cluster_scatter.png')
     
-    create_interactive_heatmap(df, 'accident_heatmap_interactive.html')
+    # Only the heatmap is built by the pipeline; create_interactive_clusters
+    # takes the same center argument when it is called separately
+    center = map_center(df)
+    create_interactive_heatmap(df, 'accident_heatmap_interactive.html', center=center)
     
     print("\nVisualization creation complete!")
 
 if __name__ == "__main__":
-    # Use clustered data if available, otherwise use cleaned data
-    try:
-        create_visualizations("hotspots_with_clusters.csv")
-    except FileNotFoundError:
-        print("Clustered data not found, using cleaned data instead...")
-        create_visualizations("US_Accidents_Cleaned.csv")
+    if len(sys.argv) > 1:
+        # Pre-sampled data with Cluster already joined (see main_pipeline.py)
+        df = load_visualization_data(sys.argv[1])
+    else:
+        # Use clustered data if available, otherwise use cleaned data
+        try:
+            df = load_visualization_data("US_Accidents_Cleaned.parquet", "hotspots_clusters.parquet")
+        except FileNotFoundError:
+            print("Clustered data not found, using cleaned data instead...")
+            df = load_visualization_data("US_Accidents_Cleaned.parquet")
+    create_visualizations(df)
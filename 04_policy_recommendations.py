@@ -9,11 +9,36 @@ Analyze accident patterns and suggest policy improvements:
 - Evidence-based recommendations
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import Counter
+from sampling import sample_csv
+
+# Columns the analyses read, with compact dtypes; Start_Time is parsed at
+# read time and RoadFeatures is the cleaned uint16 road-feature bitmask
+POLICY_COLS = {
+    'ID': 'string',
+    'Severity': 'int8',
+    'Distance(mi)': 'float32',
+    'State': 'category',
+    'Weather_Condition': 'category',
+    'RoadFeatures': 'uint16'
+}
+
+def feature_stats(bits, sev, n_features):
+    """
+    Per-feature accident counts and severity sums from a RoadFeatures bitmask
+    (bit k = feature k), via one (N, n_features) indicator matrix and a matmul.
+    
+    Returns:
+    - int64 counts, one per feature
+    - float64 severity sums, one per feature
+    """
+    F = ((bits[:, None] >> np.arange(n_features, dtype=np.uint16)) & 1).astype(np.float64)
+    return F.sum(axis=0).astype(np.int64), sev @ F
 
 def analyze_road_features(df):
     """Analyze which road features correlate with accidents"""
@@ -25,14 +50,15 @@ def analyze_road_features(df):
                      'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop',
                      'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
     
-    feature_severity = {}
-    feature_count = {}
+    # Cleaned data stores the flags as one uint16 bitmask (bit i = road_features[i]);
+    # all 13 features are counted and summed in a single pass over it
+    counts, sums = feature_stats(df['RoadFeatures'].to_numpy(dtype=np.uint16),
+                                 df['Severity'].to_numpy(dtype=np.float64),
+                                 len(road_features))
+    means = sums / np.maximum(counts, 1)
     
-    for feature in road_features:
-        with_feature = df[df[feature] == True]
-        if len(with_feature) > 0:
-            feature_severity[feature] = with_feature['Severity'].mean()
-            feature_count[feature] = len(with_feature)
+    feature_severity = {f: m for f, m, c in zip(road_features, means, counts) if c > 0}
+    feature_count = dict(zip(road_features, counts))
     
     # Sort by severity
     sorted_features = sorted(feature_severity.items(), key=lambda x: x[1], reverse=True)
@@ -52,24 +78,27 @@ def analyze_temporal_patterns(df):
     print("TEMPORAL PATTERNS ANALYSIS")
     print("="*80)
     
-    df['Start_Time'] = pd.to_datetime(df['Start_Time'], errors='coerce')
-    df['Hour'] = df['Start_Time'].dt.hour
-    df['DayOfWeek'] = df['Start_Time'].dt.day_name()
-    df['Month'] = df['Start_Time'].dt.month
+    # Group on the datetime accessors directly instead of adding
+    # Hour/DayOfWeek columns to df (no-op when Start_Time is already parsed)
+    start = pd.to_datetime(df['Start_Time'], format='ISO8601', errors='coerce', cache=True)
     
     print("\nPeak Accident Hours:")
-    hourly = df.groupby('Hour').agg({'ID': 'count', 'Severity': 'mean'}).round(2)
-    hourly.columns = ['Count', 'Avg_Severity']
+    hourly = df.groupby(start.dt.hour.rename('Hour'), observed=True, sort=False).agg(
+        Count=('ID', 'size'),
+        Avg_Severity=('Severity', 'mean')
+    ).round(2)
     hourly = hourly.sort_values('Count', ascending=False)
     print(hourly.head(10))
     
     print("\nAccidents by Day of Week:")
-    daily = df.groupby('DayOfWeek').agg({'ID': 'count', 'Severity': 'mean'}).round(2)
-    daily.columns = ['Count', 'Avg_Severity']
+    daily = df.groupby(start.dt.day_name().rename('DayOfWeek'), observed=True, sort=False).agg(
+        Count=('ID', 'size'),
+        Avg_Severity=('Severity', 'mean')
+    ).round(2)
     daily = daily.sort_values('Count', ascending=False)
     print(daily)
     
-    return df
+    return hourly, daily
 
 def analyze_geographic_risks(df):
     """Analyze geographic risk factors"""
@@ -77,12 +106,12 @@ def analyze_geographic_risks(df):
     print("GEOGRAPHIC RISK ANALYSIS")
     print("="*80)
     
-    state_stats = df.groupby('State').agg({
-        'ID': 'count',
-        'Severity': 'mean',
-        'Distance(mi)': 'mean'
-    }).round(2)
-    state_stats.columns = ['Count', 'Avg_Severity', 'Avg_Impact_Distance']
+    # State is categorical, so groupby works on its integer codes
+    state_stats = df.groupby('State', observed=True, sort=False).agg(
+        Count=('ID', 'size'),
+        Avg_Severity=('Severity', 'mean'),
+        Avg_Impact_Distance=('Distance(mi)', 'mean')
+    ).round(2)
     state_stats = state_stats.sort_values('Count', ascending=False)
     
     print("\nTop 15 States by Accident Count:")
@@ -96,14 +125,11 @@ def analyze_weather_impact(df):
     print("WEATHER IMPACT ANALYSIS")
     print("="*80)
     
-    # Handle missing weather data
-    weather_df = df[df['Weather_Condition'].notna()].copy()
-    
-    weather_stats = weather_df.groupby('Weather_Condition').agg({
-        'ID': 'count',
-        'Severity': 'mean'
-    }).round(2)
-    weather_stats.columns = ['Count', 'Avg_Severity']
+    # Missing weather is left out by dropna=True, so no filtered copy of df
+    weather_stats = df.groupby('Weather_Condition', observed=True, sort=False, dropna=True).agg(
+        Count=('ID', 'size'),
+        Avg_Severity=('Severity', 'mean')
+    ).round(2)
     weather_stats = weather_stats.sort_values('Count', ascending=False)
     
     print("\nTop 15 Weather Conditions Associated with Accidents:")
@@ -172,20 +198,40 @@ def generate_recommendations(road_features, geographic_stats, weather_stats):
         print(rec)
         print()
 
-def generate_policy_report(csv_filepath, output_file='policy_report.txt'):
-    """Generate comprehensive policy report"""
-    print("Loading data for policy analysis...")
-    df = pd.read_csv(csv_filepath)
+def load_policy_data(filepath):
+    """
+    Load and sample the data for the policy analyses
     
-    # Sample if too large
-    if len(df) > 1000000:
-        print(f"Sampling to 1M records for analysis")
-        df = df.sample(n=1000000, random_state=42)
+    Parameters:
+    - filepath: Cleaned dataset, .parquet (only POLICY_COLS are read) or .csv
     
-    road_features = analyze_road_features(df)
-    df = analyze_temporal_patterns(df)
-    geographic_stats = analyze_geographic_risks(df)
-    weather_stats = analyze_weather_impact(df)
+    Returns:
+    - DataFrame of at most 1,000,000 records
+    """
+    print("Loading data for policy analysis...")
+    columns = list(POLICY_COLS) + ['Start_Time']
+    if filepath.endswith('.parquet'):
+        df = pd.read_parquet(filepath, columns=columns).astype(POLICY_COLS)
+        total = len(df)
+        if total > 1000000:
+            df = df.sample(n=1000000, random_state=42)
+    else:
+        df, total = sample_csv(filepath, 1000000, columns, POLICY_COLS,
+                               parse_dates=['Start_Time'])
+    
+    if total > 1000000:
+        print(f"Sampled to 1M records for analysis")
+    
+    return df
+
+def generate_policy_report(df, output_file='policy_report.txt'):
+    """Generate comprehensive policy report from a loaded (and sampled) DataFrame"""
+    # Each analysis gets only the columns it reads; the slices are
+    # temporaries, freed as soon as that analysis returns
+    road_features = analyze_road_features(df[['RoadFeatures', 'Severity']])
+    analyze_temporal_patterns(df[['Start_Time', 'ID', 'Severity']])
+    geographic_stats = analyze_geographic_risks(df[['State', 'ID', 'Severity', 'Distance(mi)']])
+    weather_stats = analyze_weather_impact(df[['Weather_Condition', 'ID', 'Severity']])
     
     generate_recommendations(road_features, geographic_stats, weather_stats)
     
@@ -194,8 +240,7 @@ def generate_policy_report(csv_filepath, output_file='policy_report.txt'):
     print("="*80)
 
 if __name__ == "__main__":
-    try:
-        generate_policy_report("hotspots_with_clusters.csv")
-    except FileNotFoundError:
-        print("Clustered data not found, using cleaned data instead...")
-        generate_policy_report("US_Accidents_Cleaned.csv")
+    # The policy analysis does not use cluster labels; main_pipeline.py
+    # passes the shared pre-sampled file instead
+    filepath = sys.argv[1] if len(sys.argv) > 1 else "US_Accidents_Cleaned.parquet"
+    generate_policy_report(load_policy_data(filepath))
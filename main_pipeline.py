@@ -1,75 +1,93 @@
 """
 Main Pipeline: Road Accident Hotspot Detection
 ===============================================
-Orchestrates the complete analysis pipeline by executing scripts sequentially
+Orchestrates the complete analysis pipeline by running each script in its
+own Python process, so memory is released between steps.
+
+A step is skipped when its output file is newer than the script and the
+step's inputs; pass --force to rerun everything.
+
+Steps 3 and 4 share one pre-sampled file (SAMPLE_FILE) instead of each
+loading and sampling the full cleaned dataset.
 """
 
 import sys
 import os
+import subprocess
 
-print("\n" + "="*80)
-print("ROAD ACCIDENT HOTSPOT DETECTION - COMPLETE PIPELINE")
-print("="*80)
+# Shared sample for steps 3-4: the union of the columns they read, with
+# cluster labels joined on
+SAMPLE_FILE = "US_Accidents_Sample.parquet"
+SAMPLE_SIZE = 1_000_000
+SAMPLE_COLS = ['ID', 'Start_Lat', 'Start_Lng', 'Severity', 'City', 'State',
+               'Distance(mi)', 'Weather_Condition', 'RoadFeatures', 'Start_Time']
 
-# ============================================================================
-# STEP 0: DATA EXPLORATION
-# ============================================================================
-print("\n[STEP 0] DATA EXPLORATION")
-print("-" * 80)
-try:
-    exec(open("00_data_exploration.py").read())
-    print("✓ Data exploration complete")
-except Exception as e:
-    print(f"✗ Error in exploration: {e}")
-    sys.exit(1)
+# (title, script, arguments, inputs, output, completion message)
+STEPS = [
+    ("DATA EXPLORATION", "00_data_exploration.py", [],
+     ["US_Accidents_March23.csv"], "US_Accidents_March23.parquet",
+     "Data exploration complete"),
+    ("DATA CLEANING", "01_data_cleaning.py", [],
+     ["US_Accidents_March23.parquet"], "US_Accidents_Cleaned.parquet",
+     "Data cleaning complete"),
+    ("HOTSPOT IDENTIFICATION", "02_hotspot_identification.py", [],
+     ["US_Accidents_Cleaned.parquet"], "hotspots_clusters.parquet",
+     "Hotspot identification complete"),
+    ("VISUALIZATIONS & MAPS", "03_visualizations.py", [SAMPLE_FILE],
+     [SAMPLE_FILE], "heatmap_density.png",
+     "Visualizations created"),
+    ("POLICY RECOMMENDATIONS", "04_policy_recommendations.py", [SAMPLE_FILE],
+     [SAMPLE_FILE], None,
+     "Policy recommendations generated"),
+]
 
-# ============================================================================
-# STEP 1: DATA CLEANING
-# ============================================================================
-print("\n[STEP 1] DATA CLEANING")
-print("-" * 80)
-try:
-    exec(open("01_data_cleaning.py").read())
-    print("✓ Data cleaning complete")
-except Exception as e:
-    print(f"✗ Error in cleaning: {e}")
-    sys.exit(1)
+def is_up_to_date(script, inputs, output):
+    """Whether output exists and is newer than the script and its inputs"""
+    if output is None or not os.path.exists(output):
+        return False
+    sources = [script] + [path for path in inputs if os.path.exists(path)]
+    return os.path.getmtime(output) > max(os.path.getmtime(path) for path in sources)
 
-# ============================================================================
-# STEP 2: HOTSPOT IDENTIFICATION
-# ============================================================================
-print("\n[STEP 2] HOTSPOT IDENTIFICATION")
-print("-" * 80)
-try:
-    exec(open("02_hotspot_identification.py").read())
-    print("✓ Hotspot identification complete")
-except Exception as e:
-    print(f"✗ Error in hotspot identification: {e}")
-    sys.exit(1)
+def write_sample(cleaned="US_Accidents_Cleaned.parquet", clusters="hotspots_clusters.parquet"):
+    """Load the columns steps 3-4 read, sample once and join cluster labels"""
+    import pandas as pd
+    
+    df = pd.read_parquet(cleaned, columns=SAMPLE_COLS)
+    print(f"Sampling {min(len(df), SAMPLE_SIZE):,} of {len(df):,} records for steps 3-4...")
+    if len(df) > SAMPLE_SIZE:
+        df = df.sample(n=SAMPLE_SIZE, random_state=42)
+    if os.path.exists(clusters):
+        df = df.merge(pd.read_parquet(clusters, columns=['ID', 'Cluster']), on='ID')
+    df.to_parquet(SAMPLE_FILE, index=False, compression='zstd')
+    print(f"Saved: {SAMPLE_FILE}")
 
-# ============================================================================
-# STEP 3: VISUALIZATIONS
-# ============================================================================
-print("\n[STEP 3] VISUALIZATIONS & MAPS")
-print("-" * 80)
-try:
-    exec(open("03_visualizations.py").read())
-    print("✓ Visualizations created")
-except Exception as e:
-    print(f"✗ Error in visualizations: {e}")
-    sys.exit(1)
+force = '--force' in sys.argv[1:]
+sample_ready = False
 
-# ============================================================================
-# STEP 4: POLICY RECOMMENDATIONS
-# ============================================================================
-print("\n[STEP 4] POLICY RECOMMENDATIONS")
-print("-" * 80)
-try:
-    exec(open("04_policy_recommendations.py").read())
-    print("✓ Policy recommendations generated")
-except Exception as e:
-    print(f"✗ Error in policy recommendations: {e}")
-    sys.exit(1)
+print("\n" + "="*80)
+print("ROAD ACCIDENT HOTSPOT DETECTION - COMPLETE PIPELINE")
+print("="*80)
+
+for step, (title, script, args, inputs, output, done) in enumerate(STEPS):
+    print(f"\n[STEP {step}] {title}")
+    print("-" * 80)
+    if SAMPLE_FILE in args and not sample_ready:
+        if force or not is_up_to_date(
+                __file__, ["US_Accidents_Cleaned.parquet", "hotspots_clusters.parquet"], SAMPLE_FILE):
+            write_sample()
+        sample_ready = True
+    if not force and is_up_to_date(script, inputs, output):
+        print(f"✓ Skipped, {output} is up to date")
+        continue
+
+    # Flush so the step's own output follows this header
+    sys.stdout.flush()
+    try:
+        subprocess.run([sys.executable, script, *args], check=True)
+        print(f"✓ {done}")
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Error in {script}: exit code {e.returncode}")
+        sys.exit(1)
 
 # ============================================================================
 # COMPLETION
@@ -78,8 +96,8 @@ print("\n" + "="*80)
 print("PIPELINE COMPLETE!")
 print("="*80)
 print("\nOutput Files Generated:")
-print("  - US_Accidents_Cleaned.csv (cleaned dataset)")
-print("  - hotspots_with_clusters.csv (with cluster assignments)")
+print("  - US_Accidents_Cleaned.parquet (cleaned dataset)")
+print("  - hotspots_clusters.parquet (cluster assignments by ID)")
 print("  - hotspot_stats.csv (cluster statistics)")
 print("  - heatmap_density.png (density heatmap)")
 print("  - heatmap_severity.png (severity heatmap)")
@@ -87,4 +105,3 @@ print("  - cluster_scatter.png (cluster visualization)")
 print("  - accident_heatmap_interactive.html (interactive map)")
 print("\nAnalysis complete. Check outputs for detailed results.")
 print("="*80 + "\n")
-
@@ -0,0 +1,51 @@
+"""
+Shared sampling helper for the analysis scripts (03 and 04), used when
+they are given a CSV instead of the pre-sampled Parquet file.
+"""
+
+import pandas as pd
+import numpy as np
+
+
+def sample_csv(path, n, cols, dtype, parse_dates=None, seed=42, chunksize=1_000_000):
+    """
+    Uniformly sample up to n rows of a CSV in one chunked pass.
+    
+    Reservoir sampling (Algorithm R): memory stays O(n) however large the
+    file is, and the whole file is returned when it has n rows or fewer.
+    
+    Returns:
+    - DataFrame of the sampled rows with the given dtypes
+    - Total number of rows read
+    """
+    rng = np.random.default_rng(seed)
+    # Chunks infer their own categories, so categoricals are applied once
+    # on the final sample
+    read_dtype = {c: (object if t == 'category' else t) for c, t in dtype.items()}
+    reservoir = None
+    seen = 0
+    for chunk in pd.read_csv(path, usecols=cols, dtype=read_dtype,
+                             parse_dates=parse_dates, date_format='ISO8601',
+                             chunksize=chunksize):
+        arrays = {c: chunk[c].to_numpy() for c in chunk.columns}
+        k = len(chunk)
+        
+        # The first n rows fill the reservoir
+        fill = min(max(n - seen, 0), k)
+        if fill:
+            head = {c: a[:fill].copy() for c, a in arrays.items()}
+            reservoir = head if reservoir is None else {
+                c: np.concatenate([reservoir[c], head[c]]) for c in reservoir}
+        
+        # Row i then replaces slot j ~ U[0, i] whenever j < n; a later row
+        # overwrites an earlier one in the same slot, so keep the last hit
+        if fill < k:
+            j = rng.integers(0, np.arange(seen + fill, seen + k) + 1)
+            hits = np.flatnonzero(j < n)[::-1]
+            slots, last = np.unique(j[hits], return_index=True)
+            rows = fill + hits[last]
+            for c in reservoir:
+                reservoir[c][slots] = arrays[c][rows]
+        seen += k
+    
+    return pd.DataFrame(reservoir).astype(dtype), seen